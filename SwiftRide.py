@@ -1,112 +1,242 @@
-from abc import ABC, abstractmethod
+import logging
+import logging.handlers
+import sys
+import warnings
+from array import array
+from collections import deque, namedtuple
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import ClassVar, Deque, Iterator, List, Optional, Tuple, Union
 
 # SOLID Principles Implementation:
 # S - Single Responsibility Principle: Each class has one responsibility
-# O - Open/Closed Principle: System is open for extension (new ride types) but closed for modification
-# L - Liskov Substitution Principle: RideType implementations can be substituted
+# O - Open/Closed Principle: System is open for extension (new ride types in the rate table) but closed for modification
+# L - Liskov Substitution Principle: Any RideType can be substituted wherever a ride type is expected
 # I - Interface Segregation Principle: Interfaces are specific to their purpose
 # D - Dependency Inversion Principle: High-level modules depend on abstractions
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Booking result messages, shared by single and batch bookings
+_RIDE_FMT = "Ride Fare: $%.0f, Driver: %s"
+_NO_DRIVER_MSG = "No drivers available."
+_INVALID_TYPE_FMT = "Error booking ride: Invalid ride type: %s"
+
+class _BufferedStdoutHandler(logging.handlers.MemoryHandler):
+    """Holds records and writes them to stdout in a single call when flushed"""
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        # Flush only when the buffer is full, never because of a record's level
+        return len(self.buffer) >= self.capacity
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            lines = []
+            for record in self.buffer:
+                try:
+                    lines.append(self.format(record) + "\n")
+                except Exception:
+                    self.handleError(record)
+            last_record = self.buffer[-1] if self.buffer else None
+            self.buffer.clear()
+            if lines:
+                try:
+                    sys.stdout.write("".join(lines))
+                    sys.stdout.flush()
+                except Exception:
+                    self.handleError(last_record)
+        finally:
+            self.release()
+
+_buffered_handler: Optional[_BufferedStdoutHandler] = None
+
+def enable_buffered_output(capacity: int = 1024) -> None:
+    """Opt in to writing booking results to stdout in batches instead of one write per record.
+    
+    Results are written when capacity records have accumulated, when flush_output is
+    called, or at interpreter exit. Records still propagate to any handlers the
+    application has configured.
+    """
+    global _buffered_handler
+    if _buffered_handler is not None:
+        return
+    _buffered_handler = _BufferedStdoutHandler(capacity=capacity)
+    _buffered_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_buffered_handler)
+    if logger.getEffectiveLevel() > logging.INFO:
+        logger.setLevel(logging.INFO)
+
+def flush_output() -> None:
+    """Write any booking results held by enable_buffered_output to stdout"""
+    if _buffered_handler is not None:
+        _buffered_handler.flush()
+
+# Maximum rides kept in each customer's history; None keeps every ride
+RIDE_HISTORY_CAP: Optional[int] = None
+
 class DriverStatus(Enum):
     """Enum for driver availability status - SRP: Single responsibility for status constants"""
     AVAILABLE = "available"
     OCCUPIED = "occupied"
 
-class RideType(ABC):
-    """Abstract base class for ride types - OCP: Open for extension with new ride types"""
+@dataclass(frozen=True, slots=True)
+class RideType:
+    """Ride type defined by its name and per-mile rate - OCP: New ride types are new table entries"""
+    name: str
+    rate: float
+    
+    # Built-in ride types, assigned below the class body
+    ECONOMY: ClassVar["RideType"]
+    LUXURY: ClassVar["RideType"]
+    POOL: ClassVar["RideType"]
     
-    @abstractmethod
     def calculate_fare(self, distance: float) -> float:
         """Calculate fare based on distance"""
-        pass
+        return distance * self.rate
     
-    @abstractmethod
     def get_type_name(self) -> str:
-        """Get the name of the ride type"""
-        pass
+        """Get the name of the ride type; deprecated, read the name attribute instead"""
+        warnings.warn("RideType.get_type_name() is deprecated; use RideType.name",
+                      DeprecationWarning, stacklevel=2)
+        return self.name
 
-class EconomyRide(RideType):
-    """Economy ride implementation - SRP: Handles only economy ride logic"""
-    
-    def calculate_fare(self, distance: float) -> float:
-        return distance * 5
-    
-    def get_type_name(self) -> str:
-        return "Economy"
+RideType.ECONOMY = RideType("Economy", 5.0)
+RideType.LUXURY = RideType("Luxury", 10.0)
+RideType.POOL = RideType("Pool", 3.0)
 
-class LuxuryRide(RideType):
-    """Luxury ride implementation - SRP: Handles only luxury ride logic"""
-    
-    def calculate_fare(self, distance: float) -> float:
-        return distance * 10
-    
-    def get_type_name(self) -> str:
-        return "Luxury"
+# Ride types are stateless, so one shared instance per type is built at import.
+# Keys are interned so lookups with string literals match by identity before comparing characters.
+_RIDE_TYPES = {
+    sys.intern(ride_type.name.lower()): ride_type
+    for ride_type in (RideType.ECONOMY, RideType.LUXURY, RideType.POOL)
+}
 
-class PoolRide(RideType):
-    """Pool ride implementation - SRP: Handles only pool ride logic"""
-    
-    def calculate_fare(self, distance: float) -> float:
-        return distance * 3
-    
-    def get_type_name(self) -> str:
-        return "Pool"
+# Canonical ride type names, for validating input without fetching a ride type
+_VALID_RIDE_TYPES = frozenset(_RIDE_TYPES)
+
+# Integer codes for ride types, in table order, used by the batch fare kernel in swiftride_fast
+_RIDE_TYPE_CODES = {name: code for code, name in enumerate(_RIDE_TYPES)}
+
+# Per-mile rates indexed by ride type code
+_RATE_TABLE = tuple(
+    _RIDE_TYPES[name].rate
+    for name, _ in sorted(_RIDE_TYPE_CODES.items(), key=lambda item: item[1])
+)
 
 class RideTypeFactory:
     """Factory class to create ride types - SRP: Responsible only for creating ride types"""
     
+    @staticmethod
+    def is_valid(ride_type: str) -> bool:
+        """Check whether a name refers to a known ride type"""
+        return ride_type in _VALID_RIDE_TYPES or ride_type.lower() in _VALID_RIDE_TYPES
+    
+    @staticmethod
+    def lookup(ride_type: str) -> Optional[RideType]:
+        """Get the shared ride type instance for the given name, or None if it is unknown"""
+        # Canonical lowercase names hit on the first lookup without allocating a new string
+        return _RIDE_TYPES.get(ride_type) or _RIDE_TYPES.get(ride_type.lower())
+    
     @staticmethod
     def create_ride_type(ride_type: str) -> RideType:
-        """Create ride type based on string input"""
-        ride_types = {
-            "economy": EconomyRide(),
-            "luxury": LuxuryRide(),
-            "pool": PoolRide()
-        }
+        """Get the shared ride type instance for the given name"""
+        ride_type_obj = RideTypeFactory.lookup(ride_type)
+        if ride_type_obj is None:
+            raise ValueError(f"Invalid ride type: {ride_type}")
         
-        ride_type_lower = ride_type.lower()
-        if ride_type_lower not in ride_types:
+        return ride_type_obj
+    
+    @staticmethod
+    def code_for(ride_type: str) -> int:
+        """Get the integer code of a ride type for batch fare calculation"""
+        code = _RIDE_TYPE_CODES.get(ride_type.lower())
+        if code is None:
             raise ValueError(f"Invalid ride type: {ride_type}")
         
-        return ride_types[ride_type_lower]
+        return code
+    
+    @staticmethod
+    def rate_table() -> Tuple[float, ...]:
+        """Get the per-mile rates indexed by ride type code"""
+        return _RATE_TABLE
 
 class Driver:
     """Driver class - SRP: Manages driver information and status"""
     
+    __slots__ = ("name", "_available", "current_ride", "manager", "_index")
+    
     def __init__(self, name: str):
         self.name = name
-        self.status = DriverStatus.AVAILABLE
+        # Own availability flag, used only until DriverManager.add_driver registers the
+        # driver; from then on its byte in the manager's availability mask is the only record
+        self._available = True
         self.current_ride = None
+        self.manager: Optional["DriverManager"] = None
+        self._index = -1
+    
+    @property
+    def status(self) -> DriverStatus:
+        """Current availability status"""
+        return DriverStatus.AVAILABLE if self.is_available() else DriverStatus.OCCUPIED
     
     def is_available(self) -> bool:
         """Check if driver is available"""
-        return self.status == DriverStatus.AVAILABLE
+        if self.manager is not None:
+            return self.manager._available[self._index] == 1
+        return self._available
     
     def assign_ride(self, ride) -> None:
         """Assign a ride to the driver"""
         if not self.is_available():
             raise ValueError(f"Driver {self.name} is not available")
         
-        self.status = DriverStatus.OCCUPIED
         self.current_ride = ride
+        if self.manager is not None:
+            self.manager._mark_busy(self)
+        else:
+            self._available = False
     
     def complete_ride(self) -> None:
         """Mark ride as complete and make driver available"""
-        self.status = DriverStatus.AVAILABLE
         self.current_ride = None
+        if self.manager is not None:
+            self.manager._mark_free(self)
+        else:
+            self._available = True
 
 class Customer:
     """Customer class - SRP: Manages customer information"""
     
+    __slots__ = ("name", "ride_history", "_fares")
+    
     def __init__(self, name: str):
         self.name = name
-        self.ride_history = []
+        # Oldest rides are evicted in O(1) once RIDE_HISTORY_CAP is reached
+        self.ride_history: Deque["Ride"] = deque(maxlen=RIDE_HISTORY_CAP)
+        # Unboxed fares of every ride booked, including ones evicted from ride_history
+        self._fares = array("d")
+    
+    def record_ride(self, ride: "Ride") -> None:
+        """Add a booked ride to the customer's history"""
+        self.ride_history.append(ride)
+        self._fares.append(ride.fare)
+    
+    def total_spent(self) -> float:
+        """Total fare across all rides booked"""
+        return sum(self._fares)
+    
+    def average_fare(self) -> float:
+        """Average fare across all rides booked, or 0 if none"""
+        return sum(self._fares) / len(self._fares) if self._fares else 0.0
 
 class Ride:
     """Ride class - SRP: Manages ride information"""
     
+    __slots__ = ("customer", "pickup_location", "dropoff_location", "distance",
+                 "ride_type", "fare", "driver", "is_confirmed")
+    
     def __init__(self, customer: Customer, pickup_location: str, 
                  dropoff_location: str, distance: float, ride_type: RideType):
         self.customer = customer
@@ -114,7 +244,7 @@ class Ride:
         self.dropoff_location = dropoff_location
         self.distance = distance
         self.ride_type = ride_type
-        self.fare = ride_type.calculate_fare(distance)
+        self.fare = distance * ride_type.rate
         self.driver = None
         self.is_confirmed = False
     
@@ -129,21 +259,55 @@ class DriverManager:
     
     def __init__(self):
         self.drivers: List[Driver] = []
+        # One byte per driver, parallel to self.drivers: 1 if available, 0 if occupied
+        self._available = bytearray()
     
     def add_driver(self, driver: Driver) -> None:
         """Add a new driver to the system"""
+        # A driver tracks a single mask slot, so registering it twice would leave a stale bit
+        if driver.manager is not None:
+            raise ValueError(f"Driver {driver.name} is already registered")
+        
+        # Carry the driver's own flag into the mask, which owns availability from here on
+        self._available.append(1 if driver.is_available() else 0)
+        driver.manager = self
+        driver._index = len(self.drivers)
         self.drivers.append(driver)
     
     def get_available_driver(self) -> Optional[Driver]:
         """Get the first available driver"""
-        for driver in self.drivers:
-            if driver.is_available():
-                return driver
-        return None
+        index = self._available.find(1)
+        return self.drivers[index] if index >= 0 else None
     
-    def get_all_drivers(self) -> List[Driver]:
-        """Get all drivers"""
-        return self.drivers.copy()
+    def iter_available_drivers(self) -> Iterator[Driver]:
+        """Iterate over available drivers in order, resuming the scan after each one handed out.
+        
+        Drivers freed behind the current position are not revisited, so this suits
+        batches that only assign drivers.
+        """
+        index = self._available.find(1)
+        while index >= 0:
+            yield self.drivers[index]
+            index = self._available.find(1, index + 1)
+    
+    def _mark_busy(self, driver: Driver) -> None:
+        """Clear the availability bit of a driver that just took a ride"""
+        self._available[driver._index] = 0
+    
+    def _mark_free(self, driver: Driver) -> None:
+        """Set the availability bit of a driver that just finished a ride"""
+        self._available[driver._index] = 1
+    
+    def iter_drivers(self) -> Iterator[Driver]:
+        """Iterate over all drivers without copying the roster"""
+        return iter(self.drivers)
+    
+    def get_all_drivers(self) -> Tuple[Driver, ...]:
+        """Get an immutable snapshot of all drivers; prefer iter_drivers when only iterating"""
+        return tuple(self.drivers)
+
+# A single booking request for RideBookingService.book_rides
+RideRequest = namedtuple("RideRequest", "customer pickup dropoff distance ride_type")
 
 class RideBookingService:
     """Service for booking rides - SRP: Handles ride booking logic"""
@@ -153,28 +317,62 @@ class RideBookingService:
         self.driver_manager = driver_manager
     
     def book_ride(self, customer: Customer, pickup_location: str, 
-                  dropoff_location: str, distance: float, ride_type_str: str) -> Optional[Ride]:
-        """Book a ride for a customer"""
-        try:
-            # Create ride type using factory
-            ride_type = RideTypeFactory.create_ride_type(ride_type_str)
-            
-            # Create ride object
-            ride = Ride(customer, pickup_location, dropoff_location, distance, ride_type)
-            
-            # Try to assign a driver
-            available_driver = self.driver_manager.get_available_driver()
-            
-            if available_driver:
-                ride.assign_driver(available_driver)
-                customer.ride_history.append(ride)
-                return ride
-            else:
+                  dropoff_location: str, distance: float,
+                  ride_type: Union[str, RideType], quiet: bool = False) -> Optional[Ride]:
+        """Book a ride for a customer; quiet suppresses the invalid ride type warning"""
+        # Resolve ride type names using factory; any other ride type object is used as-is
+        if isinstance(ride_type, str):
+            ride_type_obj = RideTypeFactory.lookup(ride_type)
+            if ride_type_obj is None:
+                if not quiet:
+                    logger.warning(_INVALID_TYPE_FMT, ride_type)
                 return None
-                
-        except ValueError as e:
-            print(f"Error booking ride: {e}")
+            ride_type = ride_type_obj
+        
+        # Find a driver before building the ride so a full fleet costs no allocation
+        available_driver = self.driver_manager.get_available_driver()
+        if available_driver is None:
             return None
+        
+        ride = Ride(customer, pickup_location, dropoff_location, distance, ride_type)
+        ride.assign_driver(available_driver)
+        customer.record_ride(ride)
+        return ride
+    
+    def book_rides(self, requests: List[RideRequest],
+                   quiet: bool = False) -> List[Optional[Ride]]:
+        """Book several rides in one pass; results line up with requests"""
+        resolved_types = {}
+        available_drivers = self.driver_manager.iter_available_drivers()
+        results: List[Optional[Ride]] = []
+        add_result = results.append
+        _Ride = Ride
+        
+        for customer, pickup, dropoff, distance, ride_type in requests:
+            # Resolve each distinct ride type name only once per batch
+            if isinstance(ride_type, str):
+                ride_type_obj = resolved_types.get(ride_type)
+                if ride_type_obj is None:
+                    ride_type_obj = RideTypeFactory.lookup(ride_type)
+                    if ride_type_obj is None:
+                        if not quiet:
+                            logger.warning(_INVALID_TYPE_FMT, ride_type)
+                        add_result(None)
+                        continue
+                    resolved_types[ride_type] = ride_type_obj
+                ride_type = ride_type_obj
+            
+            driver = next(available_drivers, None)
+            if driver is None:
+                add_result(None)
+                continue
+            
+            ride = _Ride(customer, pickup, dropoff, distance, ride_type)
+            ride.assign_driver(driver)
+            customer.record_ride(ride)
+            add_result(ride)
+        
+        return results
 
 class SwiftRideSystem:
     """Main system class - SRP: Coordinates all system operations"""
@@ -197,19 +395,39 @@ class SwiftRideSystem:
         return customer
     
     def book_ride(self, customer: Customer, pickup_location: str, 
-                  dropoff_location: str, distance: float, ride_type: str) -> None:
-        """Book a ride and display result"""
+                  dropoff_location: str, distance: float,
+                  ride_type: Union[str, RideType], quiet: bool = False) -> None:
+        """Book a ride and log the result at INFO on the module logger.
+        
+        Nothing is printed unless the application configures logging (see main) or calls
+        enable_buffered_output; quiet skips reporting, including invalid ride type warnings.
+        """
         ride = self.booking_service.book_ride(
-            customer, pickup_location, dropoff_location, distance, ride_type
+            customer, pickup_location, dropoff_location, distance, ride_type, quiet
         )
         
+        if quiet:
+            return
         if ride:
-            print(f"Ride Fare: ${ride.fare:.0f}, Driver: {ride.driver.name}")
+            logger.info(_RIDE_FMT, ride.fare, ride.driver.name)
         else:
-            print("No drivers available.")
+            logger.info(_NO_DRIVER_MSG)
+    
+    def book_rides(self, requests: List[RideRequest], quiet: bool = False) -> None:
+        """Book several rides and log all results as a single record"""
+        rides = self.booking_service.book_rides(requests, quiet)
+        
+        if quiet or not rides or not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("\n".join(
+            _RIDE_FMT % (ride.fare, ride.driver.name) if ride else _NO_DRIVER_MSG
+            for ride in rides
+        ))
 
 def main():
     """Test the SwiftRide system with the given requirements"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Initialize the system
     system = SwiftRideSystem()
     
@@ -226,15 +444,15 @@ def main():
     
     # Task 6: John's ride (Airport to Downtown, 15 miles, Economy)
     print("Task 6:")
-    system.book_ride(john, "Airport", "Downtown", 15, "Economy")
+    system.book_ride(john, "Airport", "Downtown", 15, RideType.ECONOMY)
     
     # Task 7: Rebecca's ride (College to Downtown, 10 miles, Luxury)
     print("\nTask 7:")
-    system.book_ride(rebecca, "College", "Downtown", 10, "Luxury")
+    system.book_ride(rebecca, "College", "Downtown", 10, RideType.LUXURY)
     
     # Task 8: Mike's ride (Downtown to Shopping Mall, 5 miles, Pool)
     print("\nTask 8:")
-    system.book_ride(mike, "Downtown", "Shopping Mall", 5, "Pool")
+    system.book_ride(mike, "Downtown", "Shopping Mall", 5, RideType.POOL)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""Ahead-of-time build of the batch fare kernel used by swiftride_fast.
+
+Run ``python build_kernels.py`` once (requires Numba) to produce the
+``swiftride_kernels`` extension module next to this file. swiftride_fast imports it
+when present, which avoids Numba's JIT import and compile cost in short-lived processes.
+"""
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("swiftride_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+@cc.export("batch_fare", "f8[:](f8[:], i1[:], f8[:])")
+def batch_fare(distances, codes, rates):
+    out = np.empty_like(distances)
+    for i in range(distances.size):
+        out[i] = distances[i] * rates[codes[i]]
+    return out
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,48 @@
+"""Batch fare calculation for pricing many rides at once (analytics, surge simulation, replay).
+
+Requires NumPy. The kernel is taken from the ahead-of-time compiled swiftride_kernels
+extension when it has been built (see build_kernels.py); otherwise it is JIT-compiled and
+parallelised when Numba is installed, or an equivalent vectorised NumPy expression is used.
+"""
+import numpy as np
+
+from SwiftRide import RideTypeFactory
+
+# Per-mile rates indexed by ride type code (see RideTypeFactory.code_for)
+_RATES = np.array(RideTypeFactory.rate_table(), dtype=np.float64)
+
+try:
+    from swiftride_kernels import batch_fare as _batch_fare
+except ImportError:
+    try:
+        from numba import njit, prange
+    except ImportError:
+        njit = None
+    
+    if njit is not None:
+        @njit(parallel=True, fastmath=True, cache=True)
+        def _batch_fare(distances, codes, rates):
+            out = np.empty_like(distances)
+            for i in prange(distances.size):
+                out[i] = distances[i] * rates[codes[i]]
+            return out
+    else:
+        def _batch_fare(distances, codes, rates):
+            return distances * rates[codes]
+
+def batch_fare(distances: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Calculate fares for float64 distances and int8 ride type codes.
+    
+    Codes are validated before the kernel runs because the compiled kernels do not
+    bounds-check them; out-of-range codes raise ValueError on every backend.
+    """
+    distances = np.ascontiguousarray(distances, dtype=np.float64)
+    codes = np.asarray(codes)
+    if distances.ndim != 1 or codes.shape != distances.shape:
+        raise ValueError("distances and codes must be one-dimensional arrays of equal length")
+    if codes.size and not np.issubdtype(codes.dtype, np.integer):
+        raise ValueError(f"Ride type codes must be integers, not {codes.dtype}")
+    if codes.size and (codes.min() < 0 or codes.max() >= len(_RATES)):
+        raise ValueError(f"Invalid ride type code; expected 0 to {len(_RATES) - 1}")
+    
+    return _batch_fare(distances, np.ascontiguousarray(codes, dtype=np.int8), _RATES)